@@ -6,9 +6,9 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
 from sklearn.feature_selection import SelectKBest
 
-# get datasets for eligible and ineligible players from saved csv files
-eligible = pd.read_csv("eligible_player_data.csv")
-ineligible = pd.read_csv("ineligible_player_data.csv")
+# get datasets for eligible and ineligible players from saved parquet files
+eligible = pd.read_parquet("eligible_player_data.parquet")
+ineligible = pd.read_parquet("ineligible_player_data.parquet")
 
 # minor corrections needed for players with incorrect HOF status
 hof_additions = {
@@ -1,71 +1,69 @@
 import pandas as pd
 import requests
-
-from time import sleep
-from datetime import date
-from io import StringIO
-import pickle
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from time import sleep, monotonic
+from collections import Counter, deque
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local
+from urllib.parse import urljoin
+from glob import glob
+import os
+import argparse
+import logging
+import shutil
+import sys
+import re
+import unicodedata
+
+from lxml import html
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
 
 from nba_api.stats.static import players
-from nba_api.stats.endpoints import playerawards, playercareerstats
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.options import Options
-
-# prevents a Selenium window popping up every time it's used
-options = Options()
-options.add_argument("--headless")
+from nba_api.stats.endpoints import commonallplayers, playerawards, playercareerstats
+from nba_api.stats.library.http import NBAStatsHTTP
 
 # get our dataframes of inactive and active player
 inactives = pd.DataFrame(players.get_inactive_players())
 actives = pd.DataFrame(players.get_active_players())
 
-# this set is used to keep track of players who are inactive, but not long enough to
-# be HOF-eligible (4 years according to the HOF website)
-inactive_ineligibles = set()
-# this one is used for G-League players who never played in the NBA but have a page
-never_in_nba = set()
-
-# minor corrections for players whose names are just wrong, which messes things up
-inactives.loc[inactives["full_name"] == "Cui Cui", "full_name"] = "Cui Yongxi"
-inactives.loc[inactives["full_name"] == "Ike Fontaine", "full_name"] = "Isaac Fontaine"
-inactives.loc[inactives["full_name"] == "Ruben Garces", "full_name"] = "Rubén Garcés"
-inactives.loc[inactives["full_name"] == "Vincent Hunter", "full_name"] = "Vince Hunter"
-inactives.loc[inactives["full_name"] == "Ibrahim Kutluay", "full_name"] = "Ibo Kutluay"
-inactives.loc[inactives["full_name"] == "Nicolas Laprovittola", "full_name"] = (
-    "Nicolás Laprovíttola"
-)
-inactives.loc[inactives["full_name"] == "Karim Mane", "full_name"] = "Karim Mané"
-inactives.loc[inactives["full_name"] == "Boniface Ndong", "full_name"] = (
-    "Boniface N'Dong"
-)
-inactives.loc[inactives["full_name"] == "Zach Norvell Jr.", "full_name"] = (
-    "Zach Norvell"
-)
-inactives.loc[inactives["full_name"] == "JJ O'Brien", "full_name"] = "J.J. O'Brien"
-inactives.loc[inactives["full_name"] == "Maozinha Pereira", "full_name"] = (
-    "Mãozinha Pereira"
-)
-inactives.loc[inactives["full_name"] == "Filip Petrusev", "full_name"] = (
-    "Filip Petrušev"
-)
-inactives.loc[inactives["full_name"] == "Aleksandar Radojevic", "full_name"] = (
-    "Aleksandar Radojević"
-)
-inactives.loc[inactives["full_name"] == "Trevon Scott", "full_name"] = "Tre Scott"
-inactives.loc[inactives["full_name"] == "DJ Stephens", "full_name"] = "D.J. Stephens"
-inactives.loc[inactives["full_name"] == "Slavko Vranes", "full_name"] = "Slavko Vraneš"
-inactives.loc[inactives["full_name"] == "MJ Walker", "full_name"] = "M.J. Walker"
-inactives.loc[inactives["full_name"] == "Matt Williams Jr.", "full_name"] = (
-    "Matt Williams"
-)
+# minor corrections for players whose names are just wrong, which messes things up,
+# all applied in a single pass over the names
+name_fixes = {
+    "Cui Cui": "Cui Yongxi",
+    "Ike Fontaine": "Isaac Fontaine",
+    "Ruben Garces": "Rubén Garcés",
+    "Vincent Hunter": "Vince Hunter",
+    "Ibrahim Kutluay": "Ibo Kutluay",
+    "Nicolas Laprovittola": "Nicolás Laprovíttola",
+    "Karim Mane": "Karim Mané",
+    "Boniface Ndong": "Boniface N'Dong",
+    "Zach Norvell Jr.": "Zach Norvell",
+    "JJ O'Brien": "J.J. O'Brien",
+    "Maozinha Pereira": "Mãozinha Pereira",
+    "Filip Petrusev": "Filip Petrušev",
+    "Aleksandar Radojevic": "Aleksandar Radojević",
+    "Trevon Scott": "Tre Scott",
+    "DJ Stephens": "D.J. Stephens",
+    "Slavko Vranes": "Slavko Vraneš",
+    "MJ Walker": "M.J. Walker",
+    "Matt Williams Jr.": "Matt Williams",
+}
+inactives["full_name"] = inactives["full_name"].replace(name_fixes)
+
+# both are scraped together so the requests for one group can overlap with those for the
+# other, and they're only split apart again at the end
+all_players = pd.concat([inactives, actives], ignore_index=True)
 
-# we'll use the current data to find the current season
-season = date.today().year
-if date.today().month > 6:
-    # this is needed for later months (i.e. October 2025 is part of 2025-26 season)
-    season += 1
+# we'll use the current data to find the current season, reading the date only once so
+# the year and month can't straddle midnight on New Year's Eve
+today = date.today()
+# the extra year is needed for later months (i.e. October 2025 is part of 2025-26 season)
+season = today.year + (today.month > 6)
 
 # for preventing timeouts
 custom_headers = {
@@ -80,6 +78,23 @@ custom_headers = {
     "Referer": "https://www.nba.com",
 }
 
+# players are scraped by a pool of worker threads so one player's request can be in
+# flight while the next one waits its turn. Requests to each site are limited to a number
+# per rolling window of seconds rather than spaced evenly, so nobody waits until a window
+# is actually full: 6 a minute for nba.com, and 20 a minute for Basketball Reference,
+# which is the most it allows
+max_workers = 4
+nba_rate = (6, 60)
+br_rate = (20, 60)
+
+# while a checkpoint runs, its progress is saved every chunk_size players so a crash only
+# loses the chunk that was in progress
+chunk_size = 100
+
+# BR pages are plain HTML, so they're requested directly with a browser user agent
+br_url = "https://www.basketball-reference.com"
+br_headers = {"User-Agent": custom_headers["User-Agent"]}
+
 # used to manaully trigger BR scraping on HOFers who've played in the ABA for more
 # accurate predictions
 aba_hof = {
@@ -102,6 +117,43 @@ aba_hof = {
     "David Thompson",
 }
 
+# every column in a BR career statline, in order. Columns can be missing from the scraped
+# table (shooting percentages with 0 attempts, ABA stats), so they're filled in from this
+br_columns = [
+    "Season",
+    "Age",
+    "Team",
+    "Lg",
+    "Pos",
+    "G",
+    "GS",
+    "MP",
+    "FG",
+    "FGA",
+    "FG%",
+    "3P",
+    "3PA",
+    "3P%",
+    "2P",
+    "2PA",
+    "2P%",
+    "eFG%",
+    "FT",
+    "FTA",
+    "FT%",
+    "ORB",
+    "DRB",
+    "TRB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+    "Trp-Dbl",
+    "Awards",
+]
+
 # used for converting BR column names to NBA.com column names
 br_rename = {
     "G": "GP",
@@ -118,6 +170,250 @@ br_rename = {
     "TRB": "REB",
 }
 
+# used to find the career row of a BR table (e.g. "15 Yrs") and the season rows above it
+# (e.g. "2003-04"). They're compiled once here since they're checked against every row
+career_pattern = re.compile(r"^\d+ Yrs?$")
+season_pattern = re.compile(r"\d{4}-\d{2}")
+
+
+class RateLimiter:
+    """
+    Allows at most max_requests requests to a single site in any period seconds, shared
+    between all of the worker threads
+    """
+
+    def __init__(self, max_requests: int, period: float):
+        self.period = period
+        # only the last max_requests send times matter, so older ones fall off the end
+        self.sent = deque(maxlen=max_requests)
+        self.lock = Lock()
+
+    def wait(self):
+        """
+        Blocks the calling thread only if max_requests requests have already been sent
+        in the last period seconds, until the oldest of them leaves the window
+        """
+
+        # the lock makes the threads queue up, each one sleeping only as long as needed
+        with self.lock:
+            if len(self.sent) == self.sent.maxlen:
+                delay = self.sent[0] + self.period - monotonic()
+                if delay > 0:
+                    sleep(delay)
+            self.sent.append(monotonic())
+
+
+class LoggingRetry(Retry):
+    """
+    Retry policy that logs a warning every time a request is retried, so throttling and
+    timeouts show up in the output instead of just slowing things down. Retries happen
+    inside the adapter's send, so each one also waits for its turn with the site's
+    RateLimiter after the backoff, and counts against the same limit as every other
+    request
+    """
+
+    def __init__(self, *args, limiter: RateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kwargs):
+        # urllib3 makes a new copy of the policy for every attempt, which only carries
+        # over its own settings
+        return super().new(limiter=self.limiter, **kwargs)
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        self.limiter.wait()
+
+    def increment(self, method=None, url=None, response=None, error=None, **kwargs):
+        # this raises instead once the retries run out, so the warning is only logged
+        # for a retry that will actually happen
+        retry = super().increment(method, url, response, error, **kwargs)
+        reason = response.status if response is not None else error
+        logging.warning(f"Retrying {url} after {reason}")
+        return retry
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter that waits for its turn with a RateLimiter before sending a
+    request. The cached session only reaches the adapter on a cache miss, so responses
+    that are already saved locally are returned without waiting at all
+    """
+
+    def __init__(self, limiter: RateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.wait()
+        return super().send(request, **kwargs)
+
+
+# how long a cached response stays valid depends on the player it's for, so each worker
+# thread keeps track of the expiration for the player it's currently scraping
+player_expiry = local()
+
+
+class PlayerCachedSession(requests_cache.CachedSession):
+    """
+    Cached session that saves each response with the expiration set for the player the
+    calling worker thread is scraping
+    """
+
+    def request(self, *args, headers=None, expire_after=None, **kwargs):
+        if expire_after is None:
+            expire_after = getattr(player_expiry, "value", None)
+        # custom_headers asks for max-age=0, which requests-cache would otherwise obey
+        # over expire_after and never reuse the response, so that header is left off
+        if headers is not None:
+            headers = {
+                key: val
+                for key, val in headers.items()
+                if key.lower() != "cache-control"
+            }
+        return super().request(
+            *args, headers=headers, expire_after=expire_after, **kwargs
+        )
+
+
+# every nba.com and BR response is saved to a local SQLite database, so re-running the
+# scraper only goes over the network for players whose cached data has expired
+session = PlayerCachedSession("nba_cache", backend="sqlite")
+# each site's adapter keeps one pool of keep-alive connections big enough for every
+# worker, and retries throttled or failed requests itself with an exponential backoff
+# (honoring any Retry-After header) before giving up, so the scraper only slows down
+# past its rate when a site actually pushes back
+for site, rate in [("https://stats.nba.com", nba_rate), (br_url, br_rate)]:
+    limiter = RateLimiter(*rate)
+    session.mount(
+        site,
+        RateLimitedAdapter(
+            limiter,
+            pool_connections=1,
+            pool_maxsize=max_workers,
+            max_retries=LoggingRetry(
+                total=5,
+                backoff_factor=1.5,
+                backoff_jitter=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                limiter=limiter,
+            ),
+        ),
+    )
+# nba_api shares one session between all of its endpoints, so this routes them through
+# the cache
+NBAStatsHTTP.set_session(session)
+
+
+def scrape(df: pd.DataFrame, func, name: str, expire_after: dict) -> pd.DataFrame:
+    """
+    Runs one of the scraping functions on every player in a DataFrame using a pool of
+    worker threads, and collects the resulting dicts into a single DataFrame. Players are
+    scraped in chunks that are each saved to a parquet file, so if the program stops
+    partway through, running it again picks up from the last saved chunk
+
+    :param df: The DataFrame of players to scrape
+    :type df: pd.DataFrame
+    :param func: The scraping function to run on each player's row
+    :type func: Callable[[dict], dict]
+    :param name: The name of the checkpoint, used for the folder the chunks are saved in
+    :type name: str
+    :param expire_after: How long cached responses stay valid, keyed by is_active
+    :type expire_after: dict[bool, Any]
+    :return: A DataFrame of the scraped stats or awards, aligned to df's index
+    :rtype: DataFrame
+    """
+
+    folder = os.path.join("chunks", name)
+    os.makedirs(folder, exist_ok=True)
+
+    # load any chunks saved by an earlier run
+    chunks = [pd.read_parquet(path) for path in glob(os.path.join(folder, "*.parquet"))]
+
+    # chunks are indexed by player id, so anyone already saved is skipped
+    done = {player_id for chunk in chunks for player_id in chunk.index}
+    remaining = df[~df["id"].isin(done)]
+
+    def scrape_player(row: dict) -> dict | None:
+        # the session reads this to know how long to keep this player's responses
+        player_expiry.value = expire_after[row["is_active"]]
+        try:
+            return func(row)
+        except (
+            requests.exceptions.ReadTimeout,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.RetryError,
+        ):
+            # the session has already retried with a backoff by the time an error gets
+            # here, so the player is skipped for now instead of ending the whole run
+            logging.warning(f"Couldn't scrape {row['full_name']}, skipping for now")
+            return None
+        except MissingBRPlayer:
+            # a name that doesn't match BR's listing is skipped the same way, so one
+            # player can't stop the checkpoint
+            logging.warning(f"Couldn't find {row['full_name']} on BR, skipping for now")
+            return None
+
+    failed = []
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    # the progress bar starts from however many players earlier runs already saved, and
+    # log messages are printed above it instead of breaking it up
+    progress = tqdm(
+        total=len(df), initial=len(df) - len(remaining), desc=name, unit="player"
+    )
+    try:
+        for start in range(0, len(remaining), chunk_size):
+            batch = remaining.iloc[start : start + chunk_size]
+            # rows are passed as plain dicts and each player comes back as a dict, so
+            # the DataFrame is only built once per chunk instead of per player
+            rows = []
+            with logging_redirect_tqdm():
+                for player in executor.map(scrape_player, batch.to_dict("records")):
+                    rows.append(player)
+                    progress.update()
+            # players that failed are left out of the chunk, so they aren't marked done
+            ok = pd.Series([row is not None for row in rows], index=batch.index)
+            failed += batch.loc[~ok, "full_name"].to_list()
+            chunk = pd.DataFrame.from_records(
+                [row for row in rows if row is not None], index=batch.loc[ok, "id"]
+            )
+            # every scraped column is a stat, award count, or flag, so any stray text
+            # from a BR cell becomes NaN here instead of turning the whole column into
+            # objects that can't be saved to parquet
+            chunk = chunk.apply(pd.to_numeric, errors="coerce")
+
+            chunk.to_parquet(os.path.join(folder, f"{len(chunks)}.parquet"))
+            chunks.append(chunk)
+    finally:
+        # if the program is stopped, don't keep scraping the players still queued
+        executor.shutdown(cancel_futures=True)
+        progress.close()
+
+    # the chunks are kept when anyone failed, so running the program again only retries
+    # those players
+    if failed:
+        print(f"Couldn't scrape {len(failed)} players: {', '.join(failed)}")
+        # exiting with an error status lets whatever ran the scraper know it isn't done
+        sys.exit("Run the scraper again to retry them")
+
+    # the chunks are put back in the same order as df. Columns are sorted to match what
+    # apply used to produce, since hof_model.py relies on the award columns being in the
+    # same order in both datasets. A single chunk is used as is rather than copied by
+    # concat, and concat can't be given no chunks at all, which happens when df is empty
+    if len(chunks) == 1:
+        scraped = chunks[0]
+    elif chunks:
+        scraped = pd.concat(chunks)
+    else:
+        scraped = pd.DataFrame(index=df["id"])
+    scraped = scraped.reindex(df["id"]).set_axis(df.index).sort_index(axis=1)
+
+    # the checkpoint's own save takes over from here, so the chunks aren't needed anymore
+    shutil.rmtree(folder)
+    return scraped
+
 
 def rename_avgs(col: str) -> str:
     """
@@ -146,232 +442,392 @@ def rename_avgs(col: str) -> str:
     return rename + "PG"
 
 
-def clean_avgs(df: pd.DataFrame) -> pd.Series:
+# the stat columns never change, so rename_avgs is run on each of them once here and the
+# resulting dict is used for every player's averages
+avg_rename = {
+    col: rename_avgs(col)
+    for col in [
+        "GP",
+        "GS",
+        "MIN",
+        "FGM",
+        "FGA",
+        "FG_PCT",
+        "FG3M",
+        "FG3A",
+        "FG3_PCT",
+        "FTM",
+        "FTA",
+        "FT_PCT",
+        "OREB",
+        "DREB",
+        "REB",
+        "AST",
+        "STL",
+        "BLK",
+        "TOV",
+        "PF",
+        "PTS",
+    ]
+}
+
+
+# the nba.com total columns that are kept, leaving out the id columns. BR's columns are
+# renamed to these with br_rename, so both sources are read the same way
+totals_keep = [
+    "GP",
+    "GS",
+    "MIN",
+    "FGM",
+    "FGA",
+    "FG_PCT",
+    "FG3M",
+    "FG3A",
+    "FG3_PCT",
+    "FTM",
+    "FTA",
+    "FT_PCT",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+]
+
+# the nba.com average columns that are kept, leaving out the ones that are irrelevant
+# (ids, games) or redundant (shooting splits)
+avg_keep = [
+    "MIN",
+    "FGM",
+    "FGA",
+    "FG3M",
+    "FG3A",
+    "FTM",
+    "FTA",
+    "OREB",
+    "DREB",
+    "REB",
+    "AST",
+    "STL",
+    "BLK",
+    "TOV",
+    "PF",
+    "PTS",
+]
+
+# the final columns that hold fractions: shooting percentages and per-game averages, for
+# both the regular season and playoffs. Every other numeric column is a count (totals and
+# awards) or an id, so the final datasets always store the same columns the same way
+float_stats = [stat for stat in totals_keep if stat.endswith("_PCT")]
+float_stats += [avg_rename[stat] for stat in avg_keep]
+float_stats += [f"PF_{stat}" for stat in float_stats]
+
+
+def clean_totals(totals: dict | pd.Series) -> dict:
     """
-    Renames and slices the DataFrame of a player's average stats to be concatenated
-    with the rest of their stats and awards
+    Picks out the stats that are kept from a player's career totals row, from either
+    nba.com or BR, to be combined with the rest of their stats and awards
 
-    :param df: The DataFrame of a player's career average stats
-    :type df: pd.DataFrame
-    :return: A series of just the values for each stat for concatenation
-    :rtype: Series[Any]
+    :param totals: The row of a player's career totals, keyed by column name
+    :type totals: dict | pd.Series
+    :return: A dict of just the values for each stat
+    :rtype: dict[str, Any]
     """
 
-    # the rename_avgs function from before is used as the mapper in Pandas's rename
-    df.rename(columns=rename_avgs, inplace=True)
-    # the 0 row index is used to get the values while the column indices are used to
-    # remove items that are irrelevant (year, team) or redundant (shooting splits)
-    return pd.concat(
-        [df.iloc[0, 5:8], df.iloc[0, 9:11], df.iloc[0, 12:14], df.iloc[0, 15:]]
-    )
+    # columns are selected by name so a change in either site's column order can't
+    # shift them
+    return {stat: totals[stat] for stat in totals_keep}
+
 
+def clean_avgs(avgs: dict | pd.Series) -> dict:
+    """
+    Renames and picks out the stats that are kept from a player's career averages row,
+    from either nba.com or BR, to be combined with the rest of their stats and awards
 
-def insert_missing(stats: pd.Series) -> pd.Series:
+    :param avgs: The row of a player's career average stats, keyed by column name
+    :type avgs: dict | pd.Series
+    :return: A dict of just the values for each stat
+    :rtype: dict[str, Any]
+    """
+
+    # only the columns in avg_keep are looked up, and each is renamed using avg_rename
+    return {avg_rename[stat]: avgs[stat] for stat in avg_keep}
+
+
+def insert_missing(stats: dict) -> pd.Series:
     """
     Modifies a player's career statline scraped from Basketball Reference if it's
-    missing shooting percentage columns due to having 0 attempts
+    missing columns, either shooting percentages due to having 0 attempts or stats
+    that weren't tracked in the ABA
 
-    :param stats: The Series representing the career statline for a player
-    :type stats: pd.Series
-    :return: The modified Series with any missing shooting percentage columns inserted
+    :param stats: The dict representing the career statline for a player
+    :type stats: dict
+    :return: The modified Series with every column in br_columns, in that order
     :rtype: Series[Any]
     """
 
-    # This is one for ABA players in the HOF whose stats are scraped on BR
-    if "GS" not in stats:
-        stats = pd.concat([stats[:6], pd.Series({"GS": 0}), stats[6:]])
-
-    # if 0 FGs were attempted, FG% will be missing along with 2P%, 3P%, and EFG%
-    if "FG%" not in stats:
-        stats = pd.concat(
-            [
-                stats[:10],
-                pd.Series({"FG%": 0.0}),
-                stats[10:12],
-                pd.Series({"3P%": 0.0}),
-                stats[12:14],
-                pd.Series({"2P%": 0.0, "eFG%": 0.0}),
-                stats[14:],
-            ]
+    # rather than splicing each missing column into place, the full statline is built
+    # in one pass over br_columns, with a zero for anything the player is missing
+    return pd.Series({col: stats.get(col, 0) for col in br_columns})
+
+
+class MissingBRPlayer(Exception):
+    """
+    Raised when a player who needs to be scraped from BR isn't listed on BR's index page
+    for their letter
+    """
+
+
+# BR's index pages list every player whose last name starts with a given letter. Each
+# page is parsed once, the first time a player under that letter needs it, into a dict
+# of each name to the links of every player with that name
+br_index = {}
+
+
+def get_br_links(letter: str) -> dict:
+    """
+    Gets the links to the BR pages of every player listed under a letter, parsing BR's
+    index page for that letter if it hasn't been already
+
+    :param letter: The lowercase first letter of the players' last names
+    :type letter: str
+    :return: A dict of each player name to the links for the players with that name, in
+        the order BR lists them
+    :rtype: dict[str, list[str]]
+    """
+
+    if letter not in br_index:
+        # the index is the same for every player, and BR adds new players to it, so it
+        # gets its own short expiration instead of the requesting player's
+        index = session.get(
+            f"{br_url}/players/{letter}/",
+            headers=br_headers,
+            expire_after=timedelta(days=1),
         )
-    # otherwise, check 3P% and 2P% since player may have only attempted one kind
-    elif "3P%" not in stats:
-        stats = pd.concat([stats[:13], pd.Series({"3P%": 0.0}), stats[13:]])
-    elif "2P%" not in stats:
-        stats = pd.concat([stats[:16], pd.Series({"2P%": 0.0}), stats[16:]])
+        links = {}
+        for a in html.fromstring(index.content).xpath('//a[starts-with(@href, "/")]'):
+            links.setdefault(a.text, []).append(a.get("href"))
+        # two threads can parse the same page at once, but they'd build the same dict,
+        # so the second one just replaces the first
+        br_index[letter] = links
+    return br_index[letter]
+
+
+def get_br_page(row: dict) -> html.HtmlElement:
+    """
+    Finds a player's page on Basketball Reference, downloads it, and parses it. BR sends
+    its stats tables as static HTML, so a plain request gets everything a browser would
+
+    :param row: The dict representing a player from the inactive or active DataFrames
+    :type row: dict
+    :return: The parsed HTML of the player's BR page
+    :rtype: html.HtmlElement
+    """
+
+    # BR organizes players by first letter of last name, so find player in their
+    # corresponding page. The last_name field from nba_api already leaves out the first
+    # name and keeps suffixes like Jr. at the end, so only accents need to be stripped
+    # (BR files Šarić under s)
+    letter = unicodedata.normalize("NFKD", row["last_name"])[0].lower()
+    links = get_br_links(letter).get(row["full_name"])
+    if links is None:
+        raise MissingBRPlayer(row["full_name"])
+
+    # Some players have duplicate names and need the second entry to be selected
+    if row["full_name"] == "Chris Smith" or row["full_name"] == "Chris Wright":
+        player_link = links[1]
+    else:
+        player_link = links[0]
+    page = session.get(urljoin(br_url, player_link), headers=br_headers).text
+
+    # some of BR's tables are sent inside HTML comments and only shown by JavaScript, so
+    # the comment markers are dropped to make every table readable. The page is parsed
+    # once here, so reading each table later doesn't parse the whole page again
+    return html.fromstring(page.replace("<!--", "").replace("-->", ""))
+
+
+def br_value(text: str) -> float | str:
+    """
+    Converts the text of a cell in a BR table into a number where possible
+
+    :param text: The text content of the cell
+    :type text: str
+    :return: The cell as a float, its text if it isn't numeric, or NaN if it's empty
+    :rtype: float | str
+    """
+
+    try:
+        return float(text)
+    except ValueError:
+        # empty cells are shooting percentages with no attempts or untracked ABA stats
+        return text if text else float("nan")
 
-    # FT attempts is independent of FG attempts but follows same logic
-    if "FT%" not in stats:
-        stats = pd.concat([stats[:20], pd.Series({"FT%": 0.0}), stats[20:]])
 
-    # Some more ABA-specific ones; ORB and DRB with both either be present or missing
-    if "ORB" not in stats:
-        stats = pd.concat([stats[:21], pd.Series({"ORB": 0, "DRB": 0}), stats[21:]])
-    if "STL" not in stats:
-        stats = pd.concat([stats[:25], pd.Series({"STL": 0}), stats[25:]])
-    if "BLK" not in stats:
-        stats = pd.concat([stats[:26], pd.Series({"BLK": 0}), stats[26:]])
-    if "Trp-Dbl" not in stats:
-        stats = pd.concat([stats[:30], pd.Series({"Trp-Dbl": 0}), stats[30:]])
+def read_br_career(page: html.HtmlElement, table_id: str) -> dict | None:
+    """
+    Reads the career row of one of the stats tables from a player's BR page straight
+    from the parsed HTML
+
+    :param page: The parsed HTML of the player's BR page
+    :type page: html.HtmlElement
+    :param table_id: The id of the table to read (e.g. totals_stats)
+    :type table_id: str
+    :return: The player's career statline keyed by column name, or None if the page
+        doesn't have the table
+    :rtype: dict[str, Any] | None
+    """
 
-    return stats
+    # playoff tables are left out entirely for players who never made the playoffs
+    tables = page.xpath("//table[@id=$id]", id=table_id)
+    if not tables:
+        return None
+
+    # the career row is found by regex, as its position can vary if the player has
+    # played for multiple teams in their career. The footer is checked first since
+    # that's where BR puts it, and only the first cell of each row is read until then.
+    # The two are looked up separately since an XPath union would return the body first
+    for tr in tables[0].xpath("./tfoot/tr") + tables[0].xpath("./tbody/tr"):
+        cells = tr.xpath("./th|./td")
+        if cells and career_pattern.search(cells[0].text_content()):
+            columns = tables[0].xpath("./thead/tr[last()]/th")
+            return dict(
+                zip(
+                    [th.text_content() for th in columns],
+                    [br_value(cell.text_content()) for cell in cells],
+                )
+            )
 
 
-def get_totals(row: pd.Series) -> pd.Series:
+def get_totals(row: dict) -> dict:
     """
     Uses nba_api to get the career totals for each player for both the regular
-    season and playoffs. Scrapes Basketball Reference when needed and concatenates
-    Series into a Series that is attached to main DataFrame
+    season and playoffs. Scrapes Basketball Reference when needed and combines them
+    into a single dict that becomes the player's row in the main DataFrame
 
-    :param row: The Series representing a player from the inactive or active Dataframes
-    :type row: pd.Series
-    :return: A formatted Series of the player's career totals
-    :rtype: Series[Any]
+    :param row: The dict representing a player from the inactive or active DataFrames
+    :type row: dict
+    :return: A dict of the player's career totals
+    :rtype: dict[str, Any]
     """
 
-    # calls to get the player's career totals, sleeping to respect the
-    # NBA's rate limiting
-    sleep(10)
+    # these flags are returned with the player's totals, and are used to sort them into
+    # the right dataset once everyone's been scraped. inactive_ineligible marks players
+    # who are inactive, but not long enough to be HOF-eligible (4 years according to the
+    # HOF website), and never_in_nba marks G-League players who have a page but never
+    # played in the NBA
+    status = {"inactive_ineligible": False, "never_in_nba": False}
+
+    # calls to get the player's career totals; the session waits before any request
+    # that isn't cached to respect the NBA's rate limiting
     try:
         # manual trigger to BR scrape if player is an ABA HOFer (id for Bobby Jones)
         if row["full_name"] in aba_hof or row["id"] == 77193:
             # print("HOFer played in ABA:")
             raise KeyError
 
-        totals = playercareerstats.PlayerCareerStats(
+        # the raw result sets are read by name instead of building a DataFrame for
+        # each of the ten tables the endpoint returns, since only a few are used
+        career = playercareerstats.PlayerCareerStats(
             row["id"], headers=custom_headers
-        ).get_data_frames()
+        ).get_normalized_dict()
     except KeyError:
         # this and all similar print statements are for my debugging
         # print(f"{row["full_name"]} scraped on BR")
         # a KeyError will occur if the player's page on nba.com is empty. In this case,
-        # Selenium is needed to manually scrape Basketball Reference to get their
-        # career stats
-
-        # headless options from before along with adblocker because BR has a lot of ads
-        driver = webdriver.Firefox(options=options)
-        driver.install_addon("ublock_origin-1.68.0.xpi")
-
-        # BR organizes players by first letter of last name, so find player in their
-        # corresponding page
-        driver.get(
-            f"https://www.basketball-reference.com/players/{row['last_name'].lower()[0]}/"
-        )
-
-        # Some players have duplicate names and need the second entry to be selected
-        if row["full_name"] == "Chris Smith" or row["full_name"] == "Chris Wright":
-            player_link = driver.find_elements(By.LINK_TEXT, row["full_name"])[
-                1
-            ].get_attribute("href")
-        else:
-            player_link = driver.find_element(
-                By.LINK_TEXT, row["full_name"]
-            ).get_attribute("href")
-        driver.get(player_link)  # type: ignore
-
-        # use ID to get table for career totals, playoffs not needed yet
-        totals_table = driver.find_element(By.ID, "totals_stats")
-        # then convert said table to a Series for processing
-        totals = pd.read_html(StringIO(totals_table.get_attribute("outerHTML")))[0]
-
-        # get last season for inactive-ineligible check
-        last_season = (
-            int(
-                totals[totals.fillna("")["Season"].str.contains(r"\d{4}-\d{2}")].iloc[
-                    -1
-                ]["Season"][:4]
-            )
-            + 1
-        )
+        # Basketball Reference is scraped instead to get their career stats
+        page = get_br_page(row)
+
+        # get last season for inactive-ineligible check, reading just the season cell
+        # that starts each row of the totals table
+        seasons = [
+            cell.text_content()
+            for cell in page.xpath('//table[@id="totals_stats"]/tbody/tr/*[1]')
+            if season_pattern.search(cell.text_content())
+        ]
+        last_season = int(seasons[-1][:4]) + 1
         # the check for the difference not being 0 is used in place of is_active column
         if season - last_season != 0 and season - last_season <= 4:
             # print("\tAlso inactive-ineligible")
-            inactive_ineligibles.add(row["id"])
-
-        # extract the career row by regex, as it position can vary if they player has
-        # played for multiple teams in their career
-        totals = totals[totals.fillna("")["Season"].str.contains(r"^\d+ Yrs?$")].iloc[0]
-
-        # if a player has played in the playoffs, he'll have a playoff table as well
-        pf_totals_table = driver.find_elements(By.ID, "totals_stats_post")
-        has_pf = False
-        if len(pf_totals_table) == 1:
-            # if the table exists, a Series for playoff totals can be made
-            pf_totals = pd.read_html(
-                StringIO(pf_totals_table[0].get_attribute("outerHTML"))
-            )[0]
-            pf_totals = pf_totals[
-                pf_totals.fillna("")["Season"].str.contains(r"^\d+ Yrs?$")
-            ].iloc[0]
-            # this is now set to true, so playoff Series can be concatenated later
-            has_pf = True
-        driver.quit()
+            status["inactive_ineligible"] = True
+
+        # use ID to get the career row for totals
+        totals = read_br_career(page, "totals_stats")
+
+        # if a player has played in the playoffs, he'll have a playoff table as well, and
+        # has_pf is set so playoff stats can be combined later
+        pf_totals = read_br_career(page, "totals_stats_post")
+        has_pf = pf_totals is not None
 
         # from here, insert_missing will be used to ensure all required columns are
-        # present, and columns will be renamed to align with the rest of the DataFrame
-        totals = insert_missing(totals).rename(br_rename)
+        # present, and columns will be renamed to align with nba.com's before only the
+        # relevant ones are picked out
+        totals = clean_totals(insert_missing(totals).rename(br_rename))
 
-        # if the player has played in the playoffs, process their playoff Series also
+        # if the player has played in the playoffs, process their playoff stats also
         if has_pf:
             # print("\tAlso played in playoffs")
-            pf_totals = insert_missing(pf_totals).rename(br_rename).add_prefix("PF_")  # type: ignore
-            # concatenate together relevant columns from regular season and playoffs
-            return pd.concat(
-                [
-                    totals[5:14],
-                    totals[18:-2],
-                    pf_totals[5:14],
-                    pf_totals[18:-2],
-                ]
-            )
+            pf_totals = clean_totals(insert_missing(pf_totals).rename(br_rename))
+            # combine regular season and playoffs
+            return {
+                **status,
+                **totals,
+                **{f"PF_{stat}": val for stat, val in pf_totals.items()},
+            }
 
-        # concatenate to ignore irrelevant columns and return that Series
-        return pd.concat([totals[5:14], totals[18:-2]])
-    except requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError:
-        # print(f"{row['full_name']} caused a timeout")
-        quit()
+        return {**status, **totals}
 
     # the following lines are all for players with a valid nba.com page. The same
-    # transformations are applied, just from nba.com instead of BR and without Selenium
+    # transformations are applied, just from nba.com instead of BR
 
-    # if the player has no seasons, skip over them; they'll be removed later
-    if len(totals[0]) == 0:
+    # if the player has no seasons, skip over them; they'll be removed after this
+    # checkpoint
+    if len(career["SeasonTotalsRegularSeason"]) == 0:
         # print(f"{row['full_name']} never played in the NBA")
-        never_in_nba.add(row["id"])
-        return pd.Series()
+        status["never_in_nba"] = True
+        return status
 
     # for inactive players, check their last season to determine their HOF-eligibility
     if (
         row["is_active"] == False
-        and season - (int(totals[0].iloc[-1]["SEASON_ID"][:4]) + 1) <= 4
+        and season - (int(career["SeasonTotalsRegularSeason"][-1]["SEASON_ID"][:4]) + 1)
+        <= 4
     ):
         # print(f"{row['full_name']} is inactive-ineligible")
-        inactive_ineligibles.add(row["id"])
+        status["inactive_ineligible"] = True
 
     # if a player has never played a playoff game, only return their regular season
-    # totals (index 1 in the list) with slicing to only return relevant columns
-    if len(totals[3]) == 0:
-        return totals[1].iloc[0, 3:]
+    # totals, leaving out the irrelevant columns (i.e. the id columns)
+    totals = clean_totals(career["CareerTotalsRegularSeason"][0])
+    if len(career["CareerTotalsPostSeason"]) == 0:
+        return {**status, **totals}
 
-    # otherwise, add in the playoff DataFrame at index 3 with same slicing of columns
-    return pd.concat([totals[1].iloc[0, 3:], totals[3].iloc[0, 3:].add_prefix("PF_")])
+    # otherwise, add in the playoff totals with the same columns
+    pf_totals = clean_totals(career["CareerTotalsPostSeason"][0])
+    return {
+        **status,
+        **totals,
+        **{f"PF_{stat}": val for stat, val in pf_totals.items()},
+    }
 
 
-def get_avgs(row: pd.Series) -> pd.Series:
+def get_avgs(row: dict) -> dict:
     """
     Uses nba_api to get the career averages for each player for both the regular
-    season and playoffs. Scrapes Basketball Reference when needed and concatenates
-    Series into a Series that is attached to main DataFrame
+    season and playoffs. Scrapes Basketball Reference when needed and combines them
+    into a single dict that becomes the player's row in the main DataFrame
 
-    :param row: The Series representing a player from the inactive or active Dataframes
-    :type row: pd.Series
-    :return: A formatted Series of the player's career averages
-    :rtype: Series[Any]
+    :param row: The dict representing a player from the inactive or active DataFrames
+    :type row: dict
+    :return: A dict of the player's career averages
+    :rtype: dict[str, Any]
     """
 
     # this is a very similar process to get_totals, with some minor differences. Refer
     # comments in get_totals for a more detailed explanation of scraping/processing
-    sleep(10)
     try:
         if row["full_name"] in aba_hof or row["id"] == 77193:
             # print("HOFer played in ABA:")
@@ -380,253 +836,230 @@ def get_avgs(row: pd.Series) -> pd.Series:
         # per_mode36 parameter is used to indicate we want averages
         avgs = playercareerstats.PlayerCareerStats(
             row["id"], per_mode36="PerGame", headers=custom_headers
-        ).get_data_frames()
+        ).get_normalized_dict()
     except KeyError:
         # print(f"{row["full_name"]} scraped on BR")
 
-        driver = webdriver.Firefox(options=options)
-        driver.install_addon("ublock_origin-1.68.0.xpi")
-
-        driver.get(
-            f"https://www.basketball-reference.com/players/{row['last_name'].lower()[0]}/"
-        )
-
-        if row["full_name"] == "Chris Smith" or row["full_name"] == "Chris Wright":
-            player_link = driver.find_elements(By.LINK_TEXT, row["full_name"])[
-                1
-            ].get_attribute("href")
-        else:
-            player_link = driver.find_element(
-                By.LINK_TEXT, row["full_name"]
-            ).get_attribute("href")
-        driver.get(player_link)  # type: ignore
+        page = get_br_page(row)
 
         # different table on BR for career averages
-        avgs_table = driver.find_element(By.ID, "per_game_stats")
-        avgs = pd.read_html(StringIO(avgs_table.get_attribute("outerHTML")))[0]
-        avgs = avgs[avgs.fillna("")["Season"].str.contains(r"^\d+ Yrs?$")].iloc[0]
+        avgs = read_br_career(page, "per_game_stats")
 
         # inactive-ineligible status was already checked in get_totals
 
         # similarly, different table for playoff averages
-        pf_avgs_table = driver.find_elements(By.ID, "per_game_stats_post")
-        has_pf = False
-        if len(pf_avgs_table) == 1:
-            pf_avgs = pd.read_html(
-                StringIO(pf_avgs_table[0].get_attribute("outerHTML"))
-            )[0]
-            pf_avgs = pf_avgs[
-                pf_avgs.fillna("")["Season"].str.contains(r"^\d+ Yrs?$")
-            ].iloc[0]
-            has_pf = True
-        driver.quit()
-
-        # the extra rename here is to make sure average columns follow a consistent
-        # naming standard
-        avgs = insert_missing(avgs).rename(br_rename).rename(rename_avgs)
+        pf_avgs = read_br_career(page, "per_game_stats_post")
+        has_pf = pf_avgs is not None
+
+        # once BR's columns are renamed to nba.com's, clean_avgs gives averages the
+        # same consistent naming standard and leaves out games played, games started,
+        # and shooting splits, which are already included from get_totals
+        avgs = clean_avgs(insert_missing(avgs).rename(br_rename))
 
         if has_pf:
             # print("\tAlso played in playoffs")
-            # same extra rename for playoff averages
-            pf_avgs = insert_missing(pf_avgs).rename(br_rename).rename(rename_avgs).add_prefix("PF_")  # type: ignore
-            # concatenating the averages requires more splicing, as games played, games
-            # started, and shooting splits are already included from get_totals
-            return pd.concat(
-                [
-                    avgs[7:10],
-                    avgs[11:13],
-                    avgs[18:20],
-                    avgs[21:-2],
-                    pf_avgs[7:10],
-                    pf_avgs[11:13],
-                    pf_avgs[18:20],
-                    pf_avgs[21:-2],
-                ]
-            )
+            pf_avgs = clean_avgs(insert_missing(pf_avgs).rename(br_rename))
+            return {
+                **avgs,
+                **{f"PF_{stat}": val for stat, val in pf_avgs.items()},
+            }
 
-        # again, more splicing for the concatenation to avoid redundant columns
-        return pd.concat(
-            [
-                avgs[7:10],
-                avgs[11:13],
-                avgs[18:20],
-                avgs[21:-2],
-            ]
-        )
-    except requests.exceptions.ReadTimeout, requests.exceptions.ConnectionError:
-        # print(f"{row['full_name']} caused a timeout")
-        quit()
+        return avgs
 
-    if len(avgs[0]) == 0:
+    if len(avgs["SeasonTotalsRegularSeason"]) == 0:
         # print(f"{row['full_name']} never played in the NBA")
-        return pd.Series()
+        return {}
 
-    # the clean_avgs function combines renaming average columns and concatenating them
-    if len(avgs[3]) == 0:
-        return clean_avgs(avgs[1])
+    # the clean_avgs function combines renaming average columns and slicing them
+    if len(avgs["CareerTotalsPostSeason"]) == 0:
+        return clean_avgs(avgs["CareerTotalsRegularSeason"][0])
+
+    return {
+        **clean_avgs(avgs["CareerTotalsRegularSeason"][0]),
+        **{
+            f"PF_{stat}": val
+            for stat, val in clean_avgs(avgs["CareerTotalsPostSeason"][0]).items()
+        },
+    }
 
-    return pd.concat(
-        [
-            clean_avgs(avgs[1]),
-            clean_avgs(avgs[3]).add_prefix("PF_"),
-        ]
-    )
 
+# used to map All-NBA team numbers to distinguish between each team
+team_ordinals = {"1": "1st", "2": "2nd", "3": "3rd"}
 
-def get_awards(row: pd.Series) -> pd.Series:
+
+def get_awards(row: dict) -> dict:
     """
     Uses nba_api to get a list of awards a player has won and converts that into a
-    Series of number of wins for each award to be attached to the main DataFrame
+    dict of number of wins for each award to be attached to the main DataFrame
 
-    :param row: The Series representing a player from the inactive or active DataFrames
-    :type row: pd.Series
-    :return: A series of the number of times a player has won each award
-    :rtype: Series[Any]
+    :param row: The dict representing a player from the inactive or active DataFrames
+    :type row: dict
+    :return: A dict of the number of times a player has won each award
+    :rtype: dict[str, int]
     """
 
-    # call to get list of player's awards, sleeping to respect rate-limiting
-    sleep(10)
+    # call to get list of player's awards (rate-limiting is handled by the session). A
+    # player only has a few dozen awards at most, so they're counted straight from the
+    # raw rows instead of building a DataFrame for each player
     awards = playerawards.PlayerAwards(
         row["id"], headers=custom_headers
-    ).get_data_frames()[0]
-
-    # dictionary used to map All-NBA team numbers to distinguish between each team
-    team_nums = {"1": "1st", "2": "2nd", "3": "3rd"}
-    # any team number column is converted to the appropriate award in a single column
-    awards.loc[
-        awards["ALL_NBA_TEAM_NUMBER"].fillna("").str.isnumeric(), "DESCRIPTION"
-    ] = (
-        awards["ALL_NBA_TEAM_NUMBER"].map(team_nums) + " Team " + awards["DESCRIPTION"]
-    )
+    ).get_normalized_dict()["PlayerAwards"]
+
+    counts = Counter()
+    for award in awards:
+        # any team number is combined with the award's name to count each team
+        # separately, with the dict lookup doubling as the null check since missing
+        # numbers never match
+        team = team_ordinals.get(award["ALL_NBA_TEAM_NUMBER"])
+        if team is not None:
+            counts[f"{team} Team {award['DESCRIPTION']}"] += 1
+        else:
+            counts[award["DESCRIPTION"]] += 1
 
-    # if "Hall of Fame Inductee" in awards["DESCRIPTION"].values:
+    # if "Hall of Fame Inductee" in counts:
     # print(f"{row['full_name']} is a Hall of Famer")
 
     # Hall of Fame Inductee is a listed award, so HOF status will be numeric for now
-    return awards.groupby("DESCRIPTION").size()
+    return dict(counts)
 
 
-def inactive_totals():
+def save_final(df: pd.DataFrame, name: str):
     """
-    Gets total stats for inactive players df and saves it to a csv file to create a
-    checkpoint, along with preserving inactive_ineligibles and never_in_nba sets
-    """
-
-    global inactives
-    # for each function, apply will create a DataFrame that can be concatenated on
-    print("Begin scraping totals for inactive players...")
-    inactives = pd.concat([inactives, inactives.apply(get_totals, axis=1)], axis=1)
+    Saves one of the final datasets to a zstd-compressed parquet file, along with a csv
+    copy for debugging if the --csv flag was given
 
-    # adding an intermediate save to csv file as a fail-safe so I wouldn't have to
-    # repeat the entire stats process again in the event of internet going out, etc
-    inactives.to_csv("eligible_player_data.csv", index=False)
+    :param df: Finished player dataset
+    :type df: pd.DataFrame
+    :param name: File name to save under, without the extension
+    :type name: str
+    """
 
-    # inactive_ineligible and never_in_nba sets are saved to files for the same reason
-    with open("inactive_ineligibles.pkl", "wb") as file:
-        pickle.dump(inactive_ineligibles, file)
-    with open("never_in_nba.pkl", "wb") as file:
-        pickle.dump(never_in_nba, file)
+    # counting stats, awards, and player ids are stored as 32-bit integers, and every
+    # other stat in single precision, which halves the size of the files and of the
+    # DataFrames hof_model.py loads them into. Each column's type comes from its name
+    # rather than its values, so the same column never changes type between files or
+    # runs. The fillna(0) before this means every column can be converted this way
+    df = df.astype(
+        {
+            col: "float32" if col in float_stats else "int32"
+            for col in df.select_dtypes("number")
+        }
+    )
+    df.to_parquet(f"{name}.parquet", index=False, compression="zstd")
+    if args.csv:
+        df.to_csv(f"{name}.csv", index=False)
 
 
-def inactive_avgs():
-    """
-    Restores inactive df from previous checkpoint and adds on average stats before
-    saving for another checkpoint
-    """
-
-    print("Finished scraping totals for inactive players, begin scraping averages")
-    # inactives is read in after being saved at the previous checkpoint
-    inactives = pd.read_csv("eligible_player_data.csv")
-    inactives = pd.concat([inactives, inactives.apply(get_avgs, axis=1)], axis=1)
-    inactives.to_csv("eligible_player_data.csv", index=False)
+# a retired player's career stats never change, so they never need re-downloading, but
+# active players' data changes with every game, so it's only kept for a day
+stats_expiry = {False: requests_cache.NEVER_EXPIRE, True: timedelta(days=1)}
+# awards can still change after retirement (the Hall of Fame being the big one), so
+# retired players' awards are refreshed once a month
+awards_expiry = {False: timedelta(days=30), True: timedelta(days=1)}
 
 
-def inactive_awards():
+def player_totals():
     """
-    Restores inactive df from previous checkpoint, adds on awards, removes inactive-
-    ineligible and never_in_nba players, and saves it to the final csv
+    Gets total stats for every player, removes never_in_nba players, and saves the rest
+    to a parquet file to create a checkpoint
     """
 
-    print("Finished scraping stats for inactive players, begin scraping awards...")
-    inactives = pd.read_csv("eligible_player_data.csv")
-    inactives = pd.concat(
-        [inactives, inactives.apply(get_awards, axis=1)], axis=1
-    ).fillna(0)
-    print("Finished scraping awards, begin removing players and saving to csv file...")
-
-    # restore inactive_ineligibles and never_in_nba from their pickle files
-    with open("inactive_ineligibles.pkl", "rb") as file:
-        inactive_ineligibles = pickle.load(file)
-    with open("never_in_nba.pkl", "rb") as file:
-        never_in_nba = pickle.load(file)
-
-    # use the ii set to remove any of those players from the inactive df
-    inactive_ineligibles_df = inactives[inactives["id"].isin(inactive_ineligibles)]
-    # this df is saved to a file for adding later onto active df
-    inactive_ineligibles_df.to_csv("inactive_ineligibles.csv", index=False)
-    # the never_in_nba set is used in a similar manner for removal
-    never_in_nba_df = inactives[inactives["id"].isin(never_in_nba)]
-    # that df is then saved to a csv for easy access/to prevent repeated scraping
-    inactives.drop(inactive_ineligibles_df.index).drop(never_in_nba_df.index).to_csv(
-        "eligible_player_data.csv", index=False
+    global all_players
+    # two-way players who've only played in the G-League are flagged in nba.com's list of
+    # this season's players, so one request finds all of them up front instead of
+    # scraping each one only to remove them at the end. The list changes during the
+    # season, so it's cached like any other active player data
+    player_expiry.value = stats_expiry[True]
+    current = commonallplayers.CommonAllPlayers(
+        is_only_current_season=1, headers=custom_headers
+    ).get_normalized_dict()["CommonAllPlayers"]
+    g_league_only = [
+        player["PERSON_ID"] for player in current if player["GAMES_PLAYED_FLAG"] == "N"
+    ]
+    all_players = all_players[
+        ~(all_players["is_active"] & all_players["id"].isin(g_league_only))
+    ]
+
+    # for each function, scrape will create a DataFrame with the same index as
+    # all_players, so it can be joined straight on without realigning anything
+    print("Begin scraping totals...")
+    all_players = all_players.join(
+        scrape(all_players, get_totals, "totals", stats_expiry)
     )
+    # any players the up-front check missed are removed here, so their averages and
+    # awards are never requested
+    all_players = all_players[~all_players["never_in_nba"]].drop(columns="never_in_nba")
 
+    # adding an intermediate save to parquet file as a fail-safe so I wouldn't have to
+    # repeat the entire stats process again in the event of internet going out, etc. The
+    # inactive_ineligible flags are saved along with everything else
+    all_players.to_parquet("player_data.parquet", index=False)
 
-def active_totals():
-    """
-    Gets total stats for active players df and saves it to a csv file to create a
-    checkpoint
-    """
-
-    global actives
-    print("Finished saving inactives df, begin scraping totals for active players...")
-    actives = pd.concat([actives, actives.apply(get_totals, axis=1)], axis=1)
-    actives.to_csv("ineligible_player_data.csv", index=False)
-    with open("never_in_nba.pkl", "wb") as file:
-        pickle.dump(never_in_nba, file)
 
-
-def active_avgs():
+def player_avgs():
     """
-    Restores active df from previous checkpoint and adds on average stats before
+    Restores all_players df from previous checkpoint and adds on average stats before
     saving for another checkpoint
     """
 
-    print("Finished scraping totals for active players, begin scraping averages")
-    actives = pd.read_csv("ineligible_player_data.csv")
-    actives = pd.concat([actives, actives.apply(get_avgs, axis=1)], axis=1)
-    actives.to_csv("ineligible_player_data.csv", index=False)
+    print("Finished scraping totals, begin scraping averages...")
+    # all_players is read in after being saved at the previous checkpoint
+    all_players = pd.read_parquet("player_data.parquet")
+    all_players = all_players.join(scrape(all_players, get_avgs, "avgs", stats_expiry))
+    all_players.to_parquet("player_data.parquet", index=False)
 
 
-def active_awards():
+def player_awards():
     """
-    Restores active df from previous checkpoint, adds on awards, adds back inactive-
-    ineligible players, and saves it to the final csv
+    Restores all_players df from previous checkpoint, adds on awards, splits it back into
+    inactive and active players, moves inactive-ineligible players over to the active
+    side, and saves both to the final parquet files
     """
 
-    print("Finished scraping stats for active players, begin scraping awards...")
-    actives = pd.read_csv("ineligible_player_data.csv")
-    actives = pd.concat([actives, actives.apply(get_awards, axis=1)], axis=1).fillna(0)
-    print("Finished scraping awards, begin adding IIs and saving to csv file...")
+    print("Finished scraping stats, begin scraping awards...")
+    all_players = pd.read_parquet("player_data.parquet")
+    awards = scrape(all_players, get_awards, "awards", awards_expiry)
+    print("Finished scraping awards, begin splitting players and saving to file...")
+
+    # each group only gets columns for awards that at least one of its players has won,
+    # the same as if they had been scraped separately, since hof_model.py expects those
+    # exact columns
+    is_active = all_players["is_active"] == True
+    inactives = (
+        all_players[~is_active]
+        .join(awards[~is_active].dropna(axis=1, how="all"))
+        .fillna(0)
+    )
+    actives = (
+        all_players[is_active]
+        .join(awards[is_active].dropna(axis=1, how="all"))
+        .fillna(0)
+    )
 
-    # remove two-way players from never_in_nba from the active dataset
-    with open("never_in_nba.pkl", "rb") as file:
-        never_in_nba = pickle.load(file)
-    never_in_nba_df = actives[actives["id"].isin(never_in_nba)]
-    # restore inactive_ineligible df to be added onto active df
-    inactive_ineligibles_df = pd.read_csv("inactive_ineligibles.csv")
+    # use the ii flag to move any of those players from the inactive df to the active df.
+    # The flag is only meaningful for inactive players, and isn't part of either dataset
+    is_ineligible = inactives.pop("inactive_ineligible")
+    actives = actives.drop(columns="inactive_ineligible")
+    ineligibles = pd.concat([actives, inactives[is_ineligible]]).fillna(0)
 
-    pd.concat([actives.drop(never_in_nba_df.index), inactive_ineligibles_df]).fillna(
-        0
-    ).to_csv("ineligible_player_data.csv", index=False)
+    save_final(inactives[~is_ineligible], "eligible_player_data")
+    save_final(ineligibles, "ineligible_player_data")
     print("Finished scraping!")
 
 
+parser = argparse.ArgumentParser(description="Scrape NBA player data for the HOF model")
+parser.add_argument(
+    "--csv",
+    action="store_true",
+    help="also export the final datasets as csv files for debugging",
+)
+args = parser.parse_args()
+
+# only warnings (retries and skipped players) are logged, alongside the progress bars
+logging.basicConfig(format="%(levelname)s: %(message)s")
+
 # When arranged into functions like this, it's much easier to comment out a previous
 # checkpoint
-inactive_totals()
-inactive_avgs()
-inactive_awards()
-active_totals()
-active_avgs()
-active_awards()
+player_totals()
+player_avgs()
+player_awards()